@@ -1,10 +1,26 @@
 import sys
 import os
+import time
 from pathlib import Path
 
 import cv2
-from PyQt6.QtCore import Qt, QTimer, QRegularExpression
-from PyQt6.QtGui import QImage, QPixmap, QFont, QTextCharFormat, QColor, QSyntaxHighlighter
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba ist optional, der NumPy-Pfad reicht funktional
+    njit = None
+
+from PyQt6.QtCore import (
+    Qt,
+    QObject,
+    QRegularExpression,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QImage, QPainter, QFont, QTextCharFormat, QColor, QSyntaxHighlighter
 from PyQt6.QtWidgets import (
     QApplication,
     QWidget,
@@ -37,6 +53,100 @@ KEYMAP = {
 MODIFIERS = {"ctrl": 0x01, "shift": 0x02, "alt": 0x04, "gui": 0x08, "win": 0x08, "windows": 0x08}
 
 
+def _build_ascii_keycodes() -> bytes:
+    """Ein-Zeichen-Keys als flache Tabelle: ein Byte-Zugriff statt Dict-Hash.
+    KEYMAP bleibt für die Mehrzeichen-Namen ("enter", "f10", ...)."""
+    lut = bytearray(256)
+    for name, code in KEYMAP.items():
+        if len(name) == 1:
+            lut[ord(name)] = code
+    return bytes(lut)
+
+
+_ASCII_KEYCODE = _build_ascii_keycodes()
+
+
+def _build_string_tables() -> tuple[bytes, bytes]:
+    """Baut (mod, key)-Tabellen für alle 256 Bytewerte, damit der STRING-Pfad
+    pro Zeichen nur noch zwei Index-Zugriffe statt Dict-Lookups braucht."""
+    mods = bytearray(256)
+    keys = bytearray(256)
+    for b in range(256):
+        char = chr(b)
+        mod = 0
+        key = KEYMAP.get(char.lower(), 0)
+        if char.isupper() or char in r"""!@#$%^&*()_+{}|:"<>?~""":
+            mod = MODIFIERS["shift"]
+        if char == " ":
+            key = KEYMAP["space"]
+        if char == "\n":
+            key = KEYMAP["enter"]
+            mod = 0
+        mods[b] = mod if key else 0
+        keys[b] = key
+    return bytes(mods), bytes(keys)
+
+
+_STRING_MOD, _STRING_KEY = _build_string_tables()
+_NP_STRING_MOD = np.frombuffer(_STRING_MOD, np.uint8)
+_NP_STRING_KEY = np.frombuffer(_STRING_KEY, np.uint8)
+
+if njit is not None:
+    @njit(cache=True)
+    def _string_kernel(codes, key_lut, mod_lut, out):
+        """Schreibt die Reports für alle Zeichen in out (genullt, N*24 Bytes)
+        und gibt die Anzahl erzeugter Reports zurück."""
+        n = 0
+        for i in range(codes.shape[0]):
+            key = key_lut[codes[i]]
+            if key:
+                off = n * 24
+                out[off] = mod_lut[codes[i]]
+                out[off + 2] = key
+                n += 1
+        return n
+else:
+    _string_kernel = None
+
+
+# Wiederverwendeter Ausgabepuffer für _render_string. Beide Render-Pfade
+# beschreiben je Report nur Offset 0 (mod) und 2 (key) – alle übrigen Bytes
+# bleiben auf dem Null-Zustand der Erstallokation, deshalb muss zwischen den
+# Aufrufen nichts genullt werden.
+_STRING_SCRATCH = np.zeros(0, np.uint8)
+
+
+def _string_scratch(nbytes: int) -> np.ndarray:
+    global _STRING_SCRATCH
+    if _STRING_SCRATCH.shape[0] < nbytes:
+        _STRING_SCRATCH = np.zeros(max(nbytes, 4096), np.uint8)
+    return _STRING_SCRATCH[:nbytes]
+
+
+def _render_string(arg: str) -> bytes:
+    """Rendert einen STRING-Body als fertigen Block aus 24-Byte-Reports.
+
+    encode("latin-1", "ignore") verwirft Codepoints > 255, die wie bisher
+    kein Zeichen erzeugen. Mit Numba läuft die Zeichenschleife nativ
+    (cache=True, kompiliert also nur beim allerersten Lauf); ohne Numba
+    übernimmt der vektorisierte NumPy-Pfad.
+    """
+    codes = np.frombuffer(arg.encode("latin-1", "ignore"), np.uint8)
+    if _string_kernel is not None:
+        out = _string_scratch(codes.shape[0] * 24)
+        n = _string_kernel(codes, _NP_STRING_KEY, _NP_STRING_MOD, out)
+        return out[:n * 24].tobytes()
+    keys_arr = _NP_STRING_KEY[codes]
+    mask = keys_arr != 0
+    n = int(np.count_nonzero(mask))
+    if not n:
+        return b""
+    block = _string_scratch(n * 24).reshape(n, 24)
+    block[:, 0] = _NP_STRING_MOD[codes][mask]
+    block[:, 2] = keys_arr[mask]
+    return block.tobytes()
+
+
 def parse_key(key_str: str) -> tuple[int, list[int]]:
     parts = [p.strip() for p in key_str.lower().split("-")]
     mod = 0
@@ -44,17 +154,34 @@ def parse_key(key_str: str) -> tuple[int, list[int]]:
     for p in parts:
         if p in MODIFIERS:
             mod |= MODIFIERS[p]
+        elif len(p) == 1:
+            key = _ASCII_KEYCODE[ord(p)] if ord(p) < 256 else 0
+            if key:
+                keys.append(key)
         elif p in KEYMAP:
             keys.append(KEYMAP[p])
     return mod, keys
 
 
 def compile_duckyscript(text: str) -> bytes:
-    binary = bytearray()
+    # Pass 1: Zeilen in Events (mod, keys, größe) übersetzen und die
+    # Gesamtgröße aufsummieren. Ein Event ohne Keys ist reines Zero-Padding
+    # (DELAY); ein Keypress belegt 8 Bytes Report + 16 Bytes Pause = 24 Bytes.
+    # STRING-Bodies kommen als fertig gerenderte bytes-Blöcke.
+    events: list[tuple[int, tuple[int, ...] | bytes, int]] = []
+    total_len = 0
+    # Einzeldurchlauf statt splitlines(): bei großen Skripten wird keine
+    # Liste mit sämtlichen Zeilen auf einmal materialisiert
     line_nr = 0
-    for line in text.splitlines():
+    pos = 0
+    end = len(text)
+    while pos < end:
+        nl = text.find("\n", pos)
+        if nl < 0:
+            nl = end
+        line = text[pos:nl].strip()
+        pos = nl + 1
         line_nr += 1
-        line = line.strip()
         if not line or line.startswith(("REM", "//", "#")):
             continue
         parts = line.split(maxsplit=1)
@@ -64,33 +191,23 @@ def compile_duckyscript(text: str) -> bytes:
             if cmd == "DELAY":
                 ms = int(arg)
                 reports = max(1, (ms + 10) // 12)
-                binary += b"\x00" * 8 * reports
+                size = 8 * reports
+                # Aufeinanderfolgende DELAYs zu einem Padding-Event verschmelzen
+                if events and not events[-1][1]:
+                    events[-1] = (0, (), events[-1][2] + size)
+                else:
+                    events.append((0, (), size))
+                total_len += size
             elif cmd == "STRING":
-                for char in arg:
-                    mod = 0
-                    key = 0
-                    c = char.lower()
-                    if c in KEYMAP:
-                        key = KEYMAP[c]
-                    if char.isupper() or char in r"""!@#$%^&*()_+{}|:"<>?~""":
-                        mod |= MODIFIERS["shift"]
-                    if char == " ":
-                        key = KEYMAP["space"]
-                    if char == "\n":
-                        key = KEYMAP["enter"]
-                        mod = 0
-                    if key:
-                        packet = bytearray(8)
-                        packet[0] = mod
-                        packet[2] = key
-                        binary += packet
-                        binary += b"\x00" * 16
+                block = _render_string(arg)
+                if block:
+                    events.append((0, block, len(block)))
+                    total_len += len(block)
             elif cmd in ["ENTER", "TAB", "ESC", "BACKSPACE"]:
                 key = KEYMAP.get(cmd.lower(), 0)
                 if key:
-                    packet = bytearray(8)
-                    packet[2] = key
-                    binary += packet + b"\x00" * 16
+                    events.append((0, (key,), 24))
+                    total_len += 24
             else:
                 mod, keys = parse_key(cmd)
                 if arg:
@@ -98,61 +215,183 @@ def compile_duckyscript(text: str) -> bytes:
                     mod |= mod2
                     keys.extend(keys2)
                 if keys:
-                    packet = bytearray(8)
-                    packet[0] = mod
-                    for i, k in enumerate(keys[:6]):
-                        packet[2 + i] = k
-                    binary += packet + b"\x00" * 16
+                    events.append((mod, tuple(keys[:6]), 24))
+                    total_len += 24
         except Exception as e:
             print(f"Fehler Zeile {line_nr}: {line} → {e}")
-    return binary
+
+    # Pass 2: Events in einen vorab allozierten Puffer schreiben. bytearray(n)
+    # ist bereits genullt, Padding kostet also nur das Weiterrücken des Cursors.
+    buf = bytearray(total_len)
+    off = 0
+    for mod, keys, size in events:
+        if isinstance(keys, bytes):
+            buf[off:off + size] = keys
+        elif keys:
+            buf[off] = mod
+            slot = off + 2
+            for k in keys:
+                buf[slot] = k
+                slot += 1
+        off += size
+    return bytes(buf)
 
 
 # ─── Syntax Highlighting für DuckyScript ───────────────────────────────────
 class DuckyHighlighter(QSyntaxHighlighter):
-    def __init__(self, document):
-        super().__init__(document)
+    KEYWORDS = [
+        "DELAY", "STRING", "ENTER", "TAB", "ESC", "BACKSPACE",
+        "GUI", "WINDOWS", "ALT", "CTRL", "SHIFT", "REM",
+    ]
 
-        self._rules: list[tuple[QRegularExpression, QTextCharFormat]] = []
+    # Einmal pro Prozess gebaut und von allen Instanzen geteilt –
+    # QRegularExpression-Kompilierung ist nicht umsonst.
+    _RULES_CACHE: tuple[QRegularExpression, tuple[QTextCharFormat, ...]] | None = None
 
+    @classmethod
+    def _build_rules(cls) -> tuple[QRegularExpression, tuple[QTextCharFormat, ...]]:
         # Keyword-Farbe wie im Tk-Editor (#f472b6)
         kw_format = QTextCharFormat()
         kw_format.setForeground(QColor("#f472b6"))
         kw_format.setFontWeight(QFont.Weight.Bold)
 
-        keywords = [
-            "DELAY", "STRING", "ENTER", "TAB", "ESC", "BACKSPACE",
-            "GUI", "WINDOWS", "ALT", "CTRL", "SHIFT", "REM",
-        ]
-        for kw in keywords:
-            pattern = QRegularExpression(rf"\b{kw}\b")
-            self._rules.append((pattern, kw_format))
-
         # Kommentar-Farbe (#64748b)
         comment_format = QTextCharFormat()
         comment_format.setForeground(QColor("#64748b"))
 
-        # REM am Zeilenanfang oder nach Leerzeichen
-        self._rules.append(
-            (QRegularExpression(r"(^|\s)REM[^\n]*"), comment_format)
-        )
-        # // Kommentar
-        self._rules.append(
-            (QRegularExpression(r"//[^\n]*"), comment_format)
-        )
-        # # Kommentar
-        self._rules.append(
-            (QRegularExpression(r"#[^\n]*"), comment_format)
+        # Ein kombiniertes Pattern statt vier Einzelläufen pro Block.
+        # Die Kommentar-Alternativen stehen vor den Keywords, damit bei
+        # "REM foo" die ganze Zeile als Kommentar gewinnt und nicht nur
+        # das Keyword REM.
+        pattern = QRegularExpression(
+            r"(?P<comment>(?:^|\s)REM[^\n]*|//[^\n]*|#[^\n]*)"
+            rf"|(?P<kw>\b(?:{'|'.join(cls.KEYWORDS)})\b)"
         )
+        # Nur die benannten Gruppen werden ausgelesen, der Rest nicht
+        pattern.setPatternOptions(QRegularExpression.PatternOption.DontCaptureOption)
+        return pattern, (kw_format, comment_format)
+
+    # Soviel unterschiedliche Zeilen merken wir uns, danach fliegt die älteste raus
+    _FMT_CACHE_MAX = 2048
+
+    def __init__(self, document):
+        super().__init__(document)
+        if DuckyHighlighter._RULES_CACHE is None:
+            DuckyHighlighter._RULES_CACHE = self._build_rules()
+        self._pattern, self._formats = DuckyHighlighter._RULES_CACHE
+        # Zeilentext → [(start, länge, format_nr)], spart die Regex-Läufe für
+        # unveränderte/wiederholte Zeilen bei jedem Repaint
+        self._fmt_cache: dict[str, list[tuple[int, int, int]]] = {}
 
     def highlightBlock(self, text: str):
-        for pattern, fmt in self._rules:
-            it = pattern.globalMatch(text)
-            while it.hasNext():
-                m = it.next()
-                start = m.capturedStart()
-                length = m.capturedLength()
-                self.setFormat(start, length, fmt)
+        # Leere und reine Kommentarzeilen brauchen weder Cache noch Regex.
+        # startswith("REM") deckt dieselben Zeilen ab wie die
+        # (^|\s)REM[^\n]*-Alternative am Zeilenanfang.
+        stripped = text.lstrip()
+        if not stripped:
+            return
+        if stripped.startswith(("//", "#", "REM")):
+            self.setFormat(0, len(text), self._formats[1])
+            return
+
+        cached = self._fmt_cache.get(text)
+        if cached is not None:
+            for start, length, fmt_nr in cached:
+                self.setFormat(start, length, self._formats[fmt_nr])
+            return
+
+        spans: list[tuple[int, int, int]] = []
+        it = self._pattern.globalMatch(text)
+        while it.hasNext():
+            m = it.next()
+            fmt_nr = 0 if m.capturedStart("kw") >= 0 else 1
+            start = m.capturedStart()
+            length = m.capturedLength()
+            self.setFormat(start, length, self._formats[fmt_nr])
+            spans.append((start, length, fmt_nr))
+
+        if len(self._fmt_cache) >= self._FMT_CACHE_MAX:
+            # FIFO-Eviction: dicts sind einfügesortiert
+            del self._fmt_cache[next(iter(self._fmt_cache))]
+        self._fmt_cache[text] = spans
+
+
+class VideoDecodeThread(QThread):
+    """Dekodiert das Hintergrundvideo abseits des GUI-Threads."""
+
+    frameReady = pyqtSignal(QImage)
+
+    def __init__(self, cap, parent=None):
+        super().__init__(parent)
+        self._cap = cap
+        self._running = True
+        self._paused = False
+        self._last_shown = time.monotonic()
+        self._interval_ms = 33  # ~30 FPS
+        # Zwei feste Zielpuffer im Wechsel: retrieve() dekodiert direkt
+        # hinein und das QImage referenziert den Speicher ohne Kopie.
+        # Während die GUI den einen Frame zeichnet, schreiben wir den
+        # nächsten in den anderen Puffer.
+        w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self._buffers = (
+            np.empty((h, w, 3), np.uint8),
+            np.empty((h, w, 3), np.uint8),
+        )
+        self._buf_nr = 0
+
+    def _grab(self) -> bool:
+        """grab() mit Loop zurück an den Anfang am Videoende."""
+        if self._cap.grab():
+            return True
+        self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        return self._cap.grab()
+
+    def run(self):
+        while self._running:
+            if self._paused:
+                self.msleep(100)
+                continue
+            # Kommt der Decode nicht hinterher, sind Quellframes aufgelaufen.
+            # Die überspringen wir per grab() – das rückt nur vor, ohne zu
+            # dekodieren. Maximal ~1 s nachspulen, damit wir nach langen
+            # Stalls nicht im grab()-Loop hängen.
+            now = time.monotonic()
+            skip = int((now - self._last_shown) * 1000 / self._interval_ms) - 1
+            for _ in range(min(skip, 30)):
+                self._grab()
+            if self._grab():
+                buf = self._buffers[self._buf_nr]
+                ok, frame = self._cap.retrieve(buf)
+                if ok:
+                    self._last_shown = now
+                    h, w, ch = frame.shape
+                    if frame is buf:
+                        # Zero-copy: QImage zeigt direkt auf den persistenten
+                        # Puffer, keine Allokation pro Frame
+                        self._buf_nr ^= 1
+                        qimg = QImage(buf.data, w, h, ch * w, QImage.Format.Format_BGR888)
+                    else:
+                        # Backend hat den Zielpuffer nicht genutzt (z.B.
+                        # abweichende Framegröße) – dann muss kopiert werden
+                        qimg = QImage(frame.data, w, h, ch * w, QImage.Format.Format_BGR888).copy()
+                    self.frameReady.emit(qimg)
+            self.msleep(self._interval_ms)
+        self._cap.release()
+
+    def set_interval(self, ms: int):
+        """Ziel-Frameabstand in ms; die Zuweisung ist atomar, kein Lock nötig."""
+        self._interval_ms = ms
+
+    def set_paused(self, paused: bool):
+        if not paused:
+            # Sonst würde der Skip-Mechanismus die ganze Pause "nachspulen"
+            self._last_shown = time.monotonic()
+        self._paused = paused
+
+    def stop(self):
+        self._running = False
+        self.wait()
 
 
 class VideoBackgroundLabel(QLabel):
@@ -160,11 +399,9 @@ class VideoBackgroundLabel(QLabel):
 
     def __init__(self, video_path: str, parent: QWidget | None = None):
         super().__init__(parent)
-        self.setScaledContents(True)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self._cap = None
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._next_frame)
+        self._thread = None
+        self._qimg: QImage | None = None
 
         if not os.path.exists(video_path):
             QMessageBox.critical(self, "Video-Fehler", f"background.mp4 nicht gefunden:\n{video_path}")
@@ -175,47 +412,63 @@ class VideoBackgroundLabel(QLabel):
             QMessageBox.critical(self, "Video-Fehler", f"Video konnte nicht geöffnet werden:\n{video_path}")
             return
 
-        self._cap = cap
-        self._timer.start(33)  # ~30 FPS
+        # Wir zeigen immer nur den neuesten Frame, der 4-Frame-Puffer des
+        # Backends kostet nur Latenz und Speicher (Backend darf das ignorieren)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
-    def _next_frame(self):
-        if self._cap is None:
+        self._thread = VideoDecodeThread(cap, self)
+        self._thread.frameReady.connect(self._on_frame, Qt.ConnectionType.QueuedConnection)
+        self._thread.start()
+
+    def _on_frame(self, qimg: QImage):
+        # Kein QPixmap-Umweg: das QImage wird in paintEvent direkt gezeichnet
+        self._qimg = qimg
+        self.update()
+
+    def paintEvent(self, event):
+        if self._qimg is None:
+            super().paintEvent(event)
             return
-        ok, frame = self._cap.read()
-        if not ok:
-            # Loop
-            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ok, frame = self._cap.read()
-            if not ok:
-                return
-
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame.shape
-        bytes_per_line = ch * w
-        qimg = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        pix = QPixmap.fromImage(qimg)
-        self.setPixmap(pix.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                                  Qt.TransformationMode.SmoothTransformation))
+        QPainter(self).drawImage(self.rect(), self._qimg)
 
     def resizeEvent(self, event):
-        if self.pixmap() is not None:
-            self.setPixmap(
-                self.pixmap().scaled(
-                    self.size(),
-                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+        # Ein kleines Fenster braucht keinen 30-FPS-Deko-Hintergrund
+        if self._thread is not None:
+            area = self.width() * self.height()
+            self._thread.set_interval(33 if area >= 640 * 480 else 66)
         super().resizeEvent(event)
 
+    def set_paused(self, paused: bool):
+        if self._thread is not None:
+            self._thread.set_paused(paused)
+
     def close(self):
-        self._timer.stop()
-        if self._cap is not None:
-            self._cap.release()
-            self._cap = None
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
         super().close()
 
 
+class _CompileSignals(QObject):
+    finished = pyqtSignal(object)  # bytes
+    failed = pyqtSignal(str)
+
+
+class CompileJob(QRunnable):
+    """Kompiliert ein DuckyScript im globalen Threadpool."""
+
+    def __init__(self, source: str):
+        super().__init__()
+        self.signals = _CompileSignals()
+        self._source = source
+
+    def run(self):
+        try:
+            self.signals.finished.emit(compile_duckyscript(self._source))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
 class DuckyEncoderWindow(QWidget):
     def __init__(self):
         super().__init__()
@@ -223,6 +476,7 @@ class DuckyEncoderWindow(QWidget):
         self.resize(1180, 820)
 
         self.last_dir = str(Path.home() / "Desktop")
+        self._compile_job = None
 
         # Video-Hintergrund
         # Im PyInstaller-Exe-Fall liegt background.mp4 neben der EXE,
@@ -271,6 +525,7 @@ class DuckyEncoderWindow(QWidget):
 
         self.editor = QPlainTextEdit()
         self.editor.setFont(QFont("Consolas", 12))
+        self.editor.setCenterOnScroll(False)
         editor_layout.addWidget(self.editor)
 
         # Syntax-Highlighter aktivieren
@@ -314,16 +569,16 @@ class DuckyEncoderWindow(QWidget):
         sidebar_layout.addSpacing(10)
 
         btn_load = QPushButton("📂  Payload laden")
-        btn_save = QPushButton("💾  Als payload.dd speichern")
+        self.btn_save = QPushButton("💾  Als payload.dd speichern")
         btn_example = QPushButton("🔄  Beispiel laden")
         btn_clear = QPushButton("🗑️  Alles löschen")
 
         btn_load.clicked.connect(self.load_file)
-        btn_save.clicked.connect(self.compile_and_save)
+        self.btn_save.clicked.connect(self.compile_and_save)
         btn_example.clicked.connect(self.load_example)
         btn_clear.clicked.connect(self.clear_editor)
 
-        for btn in (btn_load, btn_save, btn_example, btn_clear):
+        for btn in (btn_load, self.btn_save, btn_example, btn_clear):
             sidebar_layout.addWidget(btn)
 
         sidebar_layout.addStretch(1)
@@ -360,7 +615,26 @@ class DuckyEncoderWindow(QWidget):
         self.overlay.setGeometry(self.rect())
         super().resizeEvent(event)
 
+    def showEvent(self, event):
+        self.video_label.set_paused(False)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # Minimiert/versteckt sieht den Hintergrund niemand – Decode pausieren
+        self.video_label.set_paused(True)
+        super().hideEvent(event)
+
     # ─── Editor-Aktionen ────────────────────────────────────────────────────
+    def _set_editor_text(self, content: str):
+        """Programmatisches Setzen des Editortexts ohne Undo-Historie.
+
+        Für den alten Inhalt braucht niemand Undo-Schritte, und ohne sie ist
+        setPlainText bei großen Payloads spürbar billiger.
+        """
+        self.editor.setUndoRedoEnabled(False)
+        self.editor.setPlainText(content)
+        self.editor.setUndoRedoEnabled(True)
+
     def clear_editor(self):
         self.editor.clear()
         self.status_label.setText("Editor geleert")
@@ -380,7 +654,7 @@ ENTER
 DELAY 600
 STRING Hallo vom Pico W BadUSB!
 ENTER"""
-        self.editor.setPlainText(example)
+        self._set_editor_text(example)
         self.status_label.setText("Beispiel-Payload geladen")
 
     def load_file(self):
@@ -394,7 +668,7 @@ ENTER"""
             return
         try:
             content = Path(path).read_text(encoding="utf-8", errors="replace")
-            self.editor.setPlainText(content)
+            self._set_editor_text(content)
             self.last_dir = str(Path(path).parent)
             self.status_label.setText(f"Geladen: {Path(path).name}")
         except Exception as e:
@@ -406,23 +680,32 @@ ENTER"""
             QMessageBox.warning(self, "Leer", "Nichts zum Kompilieren da.")
             return
 
+        # Kompilieren läuft im Threadpool, damit GUI und Video-Hintergrund
+        # auch bei großen Payloads nicht einfrieren
         self.status_label.setText("Kompiliere ...")
-        QApplication.processEvents()
+        self.btn_save.setEnabled(False)
+        job = CompileJob(source)
+        job.signals.finished.connect(self._on_compile_finished)
+        job.signals.failed.connect(self._on_compile_failed)
+        self._compile_job = job  # Referenz halten, solange der Job läuft
+        QThreadPool.globalInstance().start(job)
+
+    def _on_compile_finished(self, bin_data: bytes):
+        self._compile_job = None
+        self.btn_save.setEnabled(True)
+        size = len(bin_data)
+
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Payload speichern",
+            str(Path(self.last_dir) / "payload.dd"),
+            "pico-ducky Payload (*.dd *.bin);;Alle Dateien (*.*)",
+        )
+        if not path:
+            self.status_label.setText("Abgebrochen")
+            return
 
         try:
-            bin_data = compile_duckyscript(source)
-            size = len(bin_data)
-
-            path, _ = QFileDialog.getSaveFileName(
-                self,
-                "Payload speichern",
-                str(Path(self.last_dir) / "payload.dd"),
-                "pico-ducky Payload (*.dd *.bin);;Alle Dateien (*.*)",
-            )
-            if not path:
-                self.status_label.setText("Abgebrochen")
-                return
-
             Path(path).write_bytes(bin_data)
             self.last_dir = str(Path(path).parent)
             self.status_label.setText(f"Gespeichert: {size:,} Bytes → {Path(path).name}")
@@ -436,6 +719,12 @@ ENTER"""
             QMessageBox.critical(self, "Fehler", str(e))
             self.status_label.setText("Fehler beim Speichern")
 
+    def _on_compile_failed(self, message: str):
+        self._compile_job = None
+        self.btn_save.setEnabled(True)
+        QMessageBox.critical(self, "Fehler", message)
+        self.status_label.setText("Fehler beim Kompilieren")
+
     def closeEvent(self, event):
         self.video_label.close()
         super().closeEvent(event)